@@ -10,16 +10,57 @@ and comprehensive error handling for maximum reliability.
 
 import os
 import sys
-import glob
 import platform
 import subprocess
 import argparse
 import time
+import random
 import json
-import tempfile
 import hashlib
-from pathlib import Path
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import signal
+import threading
+
+# Maximum number of chunks sent to the recognition service concurrently
+MAX_RECOGNITION_WORKERS = 16
+
+# Speech recognizers work on 16 kHz mono audio, so everything is resampled to it up front
+TARGET_SAMPLE_RATE = 16000
+
+# Offline Whisper model (faster-whisper), loaded on first use and shared by all workers
+WHISPER_MODEL_SIZE = "small"
+WHISPER_LANGUAGE = "en"
+
+# Each batch process loads its own Whisper model, so batches using Whisper run one file at a time
+WHISPER_BATCH_WORKERS = 1
+_whisper_model = None
+_whisper_model_failed = False
+_whisper_lock = threading.Lock()
+
+# Shared keep-alive HTTP session for recognition requests, created on first use
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# Google requests are paced to stay just under the service's rate limit
+# (shared out between the processes of a batch)
+REQUESTS_PER_SECOND = 5
+REQUEST_BURST = MAX_RECOGNITION_WORKERS
+
+# Substrings of recognition errors caused by rate limiting, which are worth retrying
+RETRYABLE_ERRORS = ("429", "too many requests", "quota", "rate")
+
+# Optional local voice activity detection (webrtcvad): chunks with fewer than
+# VAD_MIN_SPEECH_FRAMES speech frames are not sent for recognition
+VAD_AGGRESSIVENESS = 2
+VAD_FRAME_MS = 30
+VAD_MIN_SPEECH_FRAMES = 3
+
+# Audio whose energy never rises above this level (in dBFS) is treated as empty
+NO_ACTIVITY_THRESH_DBFS = -70
+
+# 500 ms of 16-bit silence added before and after each chunk
+CHUNK_PADDING = b"\x00" * (int(0.5 * TARGET_SAMPLE_RATE) * 2)
 
 # Set up timeouts for unresponsive operations
 class TimeoutError(Exception):
@@ -31,40 +72,111 @@ def timeout_handler(signum, frame):
 # Register the signal handler for SIGALRM
 signal.signal(signal.SIGALRM, timeout_handler)
 
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    Allows bursts of up to `burst` requests, then paces them at `rate` per second.
+    """
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                needed = 1 - self.tokens
+            time.sleep(needed / self.rate)
+
+REQUEST_BUCKET = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+
+def save_config(config):
+    """Save configuration to a JSON file."""
+    config_dir = os.path.join(os.path.expanduser("~"), ".audio_transcriber")
+    os.makedirs(config_dir, exist_ok=True)
+    
+    config_path = os.path.join(config_dir, "config.json")
+    with open(config_path, "w") as f:
+        json.dump(config, f)
+    
+def load_config():
+    """Load configuration from a JSON file."""
+    config_dir = os.path.join(os.path.expanduser("~"), ".audio_transcriber")
+    config_path = os.path.join(config_dir, "config.json")
+    
+    default_config = {
+        "last_used_dir": os.path.expanduser("~"),
+        "default_output_dir": os.path.expanduser("~"),
+        "auto_detect_files": True,
+        "auto_install_deps": True,
+        "ffmpeg_path": None
+    }
+    
+    if os.path.exists(config_path):
+        try:
+            with open(config_path, "r") as f:
+                config = json.load(f)
+            # Merge with defaults for any missing keys
+            for key, value in default_config.items():
+                if key not in config:
+                    config[key] = value
+            return config
+        except Exception:
+            return default_config
+    else:
+        return default_config
+
 # Function to check and install dependencies
-def check_dependencies():
-    """Check and install required dependencies based on OS detection."""
+def check_dependencies(config=None):
+    """
+    Check and install required dependencies based on OS detection.
+    The detected FFmpeg location is stored in config (loaded if not given).
+    """
+    import importlib.util
+    import shutil
+    
     system = platform.system().lower()
     
-    # Check if pip is installed
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "--version"], 
-                              stdout=subprocess.DEVNULL, 
-                              stderr=subprocess.DEVNULL)
-    except subprocess.CalledProcessError:
+    # Check if pip is installed (a module lookup, without starting another interpreter)
+    if importlib.util.find_spec("pip") is None:
         print("Error: pip is not installed. Please install pip first.")
         sys.exit(1)
     
     # Install Python dependencies
     print("Installing required Python packages...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "SpeechRecognition", "pydub"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "SpeechRecognition", "pydub", "numpy", "requests"])
     except subprocess.CalledProcessError:
         print("Error installing Python dependencies. Please try manually:")
-        print("pip install SpeechRecognition pydub")
+        print("pip install SpeechRecognition pydub numpy requests")
         sys.exit(1)
     
     # Check and install ffmpeg based on OS
     print("Checking for FFmpeg...")
-    ffmpeg_installed = False
     
-    try:
-        subprocess.check_call(["ffmpeg", "-version"], 
-                              stdout=subprocess.DEVNULL, 
-                              stderr=subprocess.DEVNULL)
-        ffmpeg_installed = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        ffmpeg_installed = False
+    # A PATH lookup is much cheaper than spawning ffmpeg, and once found the
+    # location is remembered in the config so later runs skip even that
+    if config is None:
+        config = load_config()
+    ffmpeg_path = config.get("ffmpeg_path")
+    if not (ffmpeg_path and os.path.exists(ffmpeg_path)):
+        ffmpeg_path = shutil.which("ffmpeg")
+        if ffmpeg_path:
+            config["ffmpeg_path"] = ffmpeg_path
+            try:
+                save_config(config)
+            except Exception as e:
+                print(f"Warning: Could not save configuration: {str(e)}")
+    ffmpeg_installed = ffmpeg_path is not None
     
     if not ffmpeg_installed:
         print("FFmpeg not found. Attempting to install FFmpeg...")
@@ -85,13 +197,10 @@ def check_dependencies():
                 print("Could not detect package manager. Please install FFmpeg manually.")
         elif system == "darwin":
             # macOS - try to use Homebrew
-            try:
-                subprocess.check_call(["brew", "--version"], 
-                                     stdout=subprocess.DEVNULL, 
-                                     stderr=subprocess.DEVNULL)
+            if shutil.which("brew"):
                 print("Installing FFmpeg via Homebrew...")
                 subprocess.call(["brew", "install", "ffmpeg"])
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            else:
                 print("Homebrew not found. Please install Homebrew and then FFmpeg manually:")
                 print("  /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
                 print("  brew install ffmpeg")
@@ -101,118 +210,578 @@ def check_dependencies():
         else:
             print(f"Unsupported OS: {system}. Please install FFmpeg manually.")
 
-# Now import the modules that require the dependencies
-try:
-    import speech_recognition as sr
-    from pydub import AudioSegment
-    from pydub.silence import split_on_silence
-except ImportError:
-    print("Required Python packages not found. Installing dependencies...")
-    check_dependencies()
-    # Try importing again
-    import speech_recognition as sr
-    from pydub import AudioSegment
-    from pydub.silence import split_on_silence
+def ensure_audio_modules():
+    """
+    Make sure the audio processing packages can be imported, installing them if needed.
+    The packages themselves are imported lazily where they are used, so that
+    commands like --help and --install-deps start quickly.
+    """
+    try:
+        import speech_recognition
+        import pydub
+        import numpy
+    except ImportError:
+        print("Required Python packages not found. Installing dependencies...")
+        check_dependencies()
+
+def get_ffmpeg_path():
+    """
+    Return the ffmpeg executable remembered by check_dependencies, falling back
+    to a plain "ffmpeg" PATH lookup if none is cached or it has since moved.
+    """
+    ffmpeg_path = load_config().get("ffmpeg_path")
+    if ffmpeg_path and os.path.exists(ffmpeg_path):
+        return ffmpeg_path
+    return "ffmpeg"
+
+def audio_segment_to_samples(sound):
+    """Convert a pydub AudioSegment into a 16 kHz 16-bit mono NumPy sample array."""
+    import numpy as np
+    
+    sound = sound.set_frame_rate(TARGET_SAMPLE_RATE).set_channels(1).set_sample_width(2)
+    return np.frombuffer(sound.raw_data, dtype=np.int16)
+
+def _try_fast_wav_load(audio_path):
+    """
+    Memory-map the samples of a WAV file that is already 16 kHz 16-bit mono.
+    
+    Returns:
+        Read-only NumPy int16 array backed by the file, or None if the file
+        needs decoding
+    """
+    import mmap
+    import wave
+    import numpy as np
+    
+    try:
+        with open(audio_path, "rb") as f:
+            with wave.open(f) as wav_file:
+                params = wav_file.getparams()
+                # The reader stops at the start of the sample data
+                offset = f.tell()
+            if (params.nchannels, params.sampwidth, params.framerate) != (1, 2, TARGET_SAMPLE_RATE) \
+                    or not params.nframes:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (wave.Error, EOFError, OSError, ValueError):
+        return None
+    count = min(params.nframes, (len(mapped) - offset) // 2)
+    return np.frombuffer(mapped, dtype=np.int16, count=count, offset=offset)
+
+def load_wav_samples(audio_path):
+    """
+    Load a WAV file as a 16 kHz 16-bit mono NumPy sample array.
+    Files already in that format are memory-mapped directly. Others are read
+    with soundfile and resampled with scipy when both are installed, otherwise
+    they go through pydub.
+    
+    Args:
+        audio_path: Path to the WAV audio file
+        
+    Returns:
+        NumPy int16 array of samples
+    """
+    import numpy as np
+    
+    samples = _try_fast_wav_load(audio_path)
+    if samples is not None:
+        return samples
+    
+    try:
+        import soundfile as sf
+        from scipy.signal import resample_poly
+    except ImportError:
+        from pydub import AudioSegment
+        return audio_segment_to_samples(AudioSegment.from_wav(audio_path))
+    
+    data, sample_rate = sf.read(audio_path, dtype="int16")
+    if data.ndim == 1 and sample_rate == TARGET_SAMPLE_RATE:
+        return data
+    
+    # Mix down to mono and resample with a polyphase filter
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    if sample_rate != TARGET_SAMPLE_RATE:
+        data = resample_poly(data, TARGET_SAMPLE_RATE, sample_rate)
+    return np.clip(np.round(data), -32768, 32767).astype(np.int16)
 
-def convert_to_wav(audio_path):
+def decode_audio(audio_path):
     """
-    Convert audio file to WAV format if it's not already.
-    Includes multiple conversion methods for redundancy.
+    Decode an audio file into memory if it's not already a WAV file.
+    ffmpeg's raw PCM output is piped straight into a NumPy array, so no
+    intermediate WAV file is written. Includes multiple decoding methods for redundancy.
+    
+    Args:
+        audio_path: Path to the audio file
+        
+    Returns:
+        16 kHz 16-bit mono NumPy sample array, or the original path for WAV
+        files and as a last resort
     """
-    if audio_path.endswith('.wav'):
+    import numpy as np
+    from pydub import AudioSegment
+    
+    if os.path.splitext(audio_path)[1].lower() == '.wav':
         return audio_path
     
-    filename = os.path.splitext(os.path.basename(audio_path))[0]
-    output_path = f"{filename}_converted.wav"
-    temp_output_path = f"{filename}_temp.wav"
+    ffmpeg_path = get_ffmpeg_path()
     
-    # Primary conversion method using pydub
+    # Primary decoding method: stream 16-bit mono PCM from ffmpeg through a pipe
     try:
-        print(f"Attempting to convert {audio_path} to WAV using primary method...")
-        audio = AudioSegment.from_file(audio_path)
-        audio.export(output_path, format="wav")
-        print(f"Converted {audio_path} to {output_path}")
-        return output_path
+        print(f"Attempting to decode {audio_path} using primary method...")
+        process = subprocess.Popen(
+            [ffmpeg_path, "-nostdin", "-i", audio_path, "-vn", "-f", "s16le", "-acodec", "pcm_s16le",
+             "-ac", "1", "-ar", str(TARGET_SAMPLE_RATE), "pipe:1"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20  # Large pipe buffer to avoid syscall thrash on big payloads
+        )
+        with process.stdout:
+            raw = process.stdout.read()
+        if process.wait() != 0 or not raw:
+            raise Exception(f"ffmpeg exited with status {process.returncode}")
+        print(f"Decoded {audio_path} in memory")
+        return np.frombuffer(raw, dtype=np.int16)
     except Exception as e:
-        print(f"Primary conversion method failed: {str(e)}")
-        print("Trying backup conversion method...")
+        print(f"Primary decoding method failed: {str(e)}")
+        print("Trying backup decoding method...")
         
-        # Backup conversion method using ffmpeg directly
+        # Backup decoding method using pydub
         try:
-            # Determine platform-specific command execution
-            if platform.system().lower() == "windows":
-                subprocess.check_call(
-                    ["ffmpeg", "-i", audio_path, "-acodec", "pcm_s16le", "-ar", "44100", temp_output_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            else:
-                subprocess.check_call(
-                    ["ffmpeg", "-i", audio_path, "-acodec", "pcm_s16le", "-ar", "44100", temp_output_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            
-            # Verify the backup conversion worked
-            if os.path.exists(temp_output_path) and os.path.getsize(temp_output_path) > 0:
-                os.rename(temp_output_path, output_path)
-                print(f"Backup conversion successful: {output_path}")
-                return output_path
-            else:
-                raise Exception("Backup conversion produced invalid file")
-                
+            AudioSegment.converter = ffmpeg_path
+            samples = audio_segment_to_samples(AudioSegment.from_file(audio_path))
+            print(f"Backup decoding successful: {audio_path}")
+            return samples
         except Exception as backup_error:
-            print(f"Backup conversion also failed: {str(backup_error)}")
+            print(f"Backup decoding also failed: {str(backup_error)}")
             print("Returning original file for last-resort processing attempt...")
             return audio_path  # Return original as last resort
 
-def transcribe_large_audio(audio_path, min_silence_len=500, silence_thresh=-40):
+def compute_energy_db(samples, window_ms=10):
+    """
+    Compute the windowed RMS energy of every sample in dBFS.
+    The result can be thresholded repeatedly without rescanning the audio.
+    
+    Args:
+        samples: 16 kHz 16-bit mono NumPy sample array
+        window_ms: Length of the RMS analysis window (in ms)
+        
+    Returns:
+        NumPy array with one dBFS value per sample
+    """
+    import numpy as np
+    
+    if not len(samples):
+        return np.empty(0, dtype=np.float32)
+    win = min(len(samples), max(1, int(TARGET_SAMPLE_RATE * window_ms / 1000)))
+    
+    # Windowed mean-square energy as a moving average over a running sum of
+    # squares: O(N) regardless of window length, unlike a direct convolution.
+    # The audio is processed in blocks so the int64 temporaries stay a few MB
+    # even for hours of audio; the only full-length array is the float32 result
+    # (4 bytes per sample). Block-local int64 sums are exact.
+    total = len(samples)
+    windows = total - win + 1
+    head = win // 2
+    energy_db = np.empty(total, dtype=np.float32)
+    block = 1 << 20
+    for start in range(0, windows, block):
+        stop = min(start + block, windows)
+        squares = samples[start:stop + win - 1].astype(np.int64)
+        squares *= squares
+        cumulative = np.empty(len(squares) + 1, dtype=np.int64)
+        cumulative[0] = 0
+        np.cumsum(squares, out=cumulative[1:])
+        out = energy_db[head + start:head + stop]
+        np.subtract(cumulative[win:], cumulative[:-win], out=out, casting="unsafe")
+        out /= win
+        out += 1e-9
+        np.log10(out, out=out)
+        out *= 10
+        out -= 20 * np.log10(32768)
+    
+    # Center each window on its sample, repeating the edge values so there is one value per sample
+    energy_db[:head] = energy_db[head]
+    energy_db[head + windows:] = energy_db[head + windows - 1]
+    return energy_db
+
+def fast_split_on_silence(samples, min_silence_len=500, silence_thresh_db=-40, keep_silence=100,
+                          window_ms=10, energy_db=None):
+    """
+    Split audio where silence is detected, using a vectorized RMS scan.
+    Behaves like pydub's split_on_silence but avoids its per-millisecond Python loop.
+    
+    Args:
+        samples: 16 kHz 16-bit mono NumPy sample array to split
+        min_silence_len: Minimum length of silence (in ms) to be used as a split point
+        silence_thresh_db: Silence threshold in dBFS
+        keep_silence: Amount of silence (in ms) to keep on each side of a chunk
+        window_ms: Length of the RMS analysis window (in ms)
+        energy_db: Energy array from a previous call, to re-threshold without rescanning
+        
+    Returns:
+        Tuple of (list of non-silent sample array views, energy array in dBFS)
+    """
+    import numpy as np
+    
+    if energy_db is None:
+        energy_db = compute_energy_db(samples, window_ms)
+    if not len(energy_db):
+        return [], energy_db
+    silent = energy_db < silence_thresh_db
+    
+    # Find runs of silent samples and keep those long enough to split on
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    long_runs = (run_ends - run_starts) >= int(min_silence_len * TARGET_SAMPLE_RATE / 1000)
+    run_starts, run_ends = run_starts[long_runs], run_ends[long_runs]
+    
+    # Speech lies between consecutive silent runs
+    total = len(energy_db)
+    keep = int(keep_silence * TARGET_SAMPLE_RATE / 1000)
+    chunks = []
+    for start, end in zip(np.concatenate(([0], run_ends)), np.concatenate((run_starts, [total]))):
+        if end > start:
+            chunks.append(samples[max(0, start - keep):min(total, end + keep)])
+    return chunks, energy_db
+
+def has_speech(samples):
+    """
+    Check a chunk for speech with WebRTC voice activity detection, if installed.
+    Chunks that only just crossed the silence threshold often hold no speech,
+    and skipping them saves a recognition request that would fail anyway.
+    
+    Args:
+        samples: 16 kHz 16-bit mono NumPy sample array
+        
+    Returns:
+        False if fewer than VAD_MIN_SPEECH_FRAMES frames are classed as speech,
+        True otherwise (and always True when webrtcvad isn't installed)
+    """
+    try:
+        import webrtcvad
+    except ImportError:
+        return True
+    
+    vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+    raw = samples.tobytes()
+    frame_bytes = TARGET_SAMPLE_RATE * VAD_FRAME_MS // 1000 * 2
+    speech_frames = 0
+    for start in range(0, len(raw) - frame_bytes + 1, frame_bytes):
+        if vad.is_speech(raw[start:start + frame_bytes], TARGET_SAMPLE_RATE):
+            speech_frames += 1
+            if speech_frames >= VAD_MIN_SPEECH_FRAMES:
+                return True
+    return False
+
+def coalesce_chunks(chunks, min_chunk_ms=12000, max_chunk_ms=30000):
+    """
+    Merge consecutive short chunks so each recognition request carries at least
+    about min_chunk_ms of audio. Silence splitting can produce many sub-second
+    chunks, each costing a full request round trip; merged chunks need fewer
+    requests and give the recognizer more context. A chunk is never grown past
+    max_chunk_ms, and chunks that are already long are left as they are.
+    
+    Args:
+        chunks: List of 16 kHz 16-bit mono NumPy sample arrays, in order
+        min_chunk_ms: Length (in ms) a merged chunk is grown to
+        max_chunk_ms: Longest merged chunk (in ms)
+        
+    Returns:
+        List of merged sample arrays, in order
+    """
+    import numpy as np
+    
+    min_len = int(min_chunk_ms * TARGET_SAMPLE_RATE / 1000)
+    max_len = int(max_chunk_ms * TARGET_SAMPLE_RATE / 1000)
+    groups = []
+    group_len = 0
+    for chunk in chunks:
+        # Start a new group once the current one is long enough or this chunk would overfill it
+        if not groups or group_len >= min_len or group_len + len(chunk) > max_len:
+            groups.append([])
+            group_len = 0
+        groups[-1].append(chunk)
+        group_len += len(chunk)
+    return [group[0] if len(group) == 1 else np.concatenate(group) for group in groups]
+
+def make_audio_data(raw_data):
+    """
+    Wrap 16 kHz 16-bit mono PCM as sr.AudioData whose FLAC upload is encoded only once.
+    The audio is already at the rate and width Google expects, so no conversion
+    happens before encoding, and SpeechRecognition encodes at the highest
+    compression level (--best). Memoizing the encoding means retries and
+    fallback Google requests for the same chunk reuse the compressed bytes.
+    """
+    import speech_recognition as sr
+    
+    audio_data = sr.AudioData(raw_data, TARGET_SAMPLE_RATE, 2)
+    audio_data.get_flac_data = functools.lru_cache(maxsize=None)(audio_data.get_flac_data)
+    return audio_data
+
+def get_whisper_model():
+    """
+    Load the offline faster-whisper model once and share it between all workers.
+    The int8-quantized model runs well on CPU-only machines and uses CUDA when available.
+    
+    Returns:
+        WhisperModel instance, or None if faster-whisper is unavailable
+    """
+    global _whisper_model, _whisper_model_failed
+    with _whisper_lock:
+        if _whisper_model is None and not _whisper_model_failed:
+            try:
+                from faster_whisper import WhisperModel
+                print(f"Loading Whisper '{WHISPER_MODEL_SIZE}' model for offline recognition...")
+                _whisper_model = WhisperModel(WHISPER_MODEL_SIZE, device="auto", compute_type="int8")
+            except Exception as e:
+                print(f"Offline Whisper recognition unavailable ({str(e)}). Using Google recognition.")
+                _whisper_model_failed = True
+        return _whisper_model
+
+def recognition_backend():
+    """
+    Name the recognizer that transcriptions will come from, including the Whisper
+    model and language, so cached results from different backends never mix.
+    """
+    import importlib.util
+    
+    if _whisper_model is not None or (
+            not _whisper_model_failed and importlib.util.find_spec("faster_whisper") is not None):
+        return f"whisper-{WHISPER_MODEL_SIZE}-{WHISPER_LANGUAGE}"
+    return "google"
+
+def recognize_whisper_local(model, audio_data):
     """
-    Split the audio file into chunks and apply speech recognition on each chunk.
+    Transcribe sr.AudioData with a local faster-whisper model.
+    Raises the same exceptions as the SpeechRecognition recognizers.
+    """
+    import numpy as np
+    import speech_recognition as sr
+    
+    samples = np.frombuffer(audio_data.frame_data, dtype=np.int16).astype(np.float32) / 32768.0
+    try:
+        # Fixing the language skips per-chunk language detection, which is slow
+        # and misfires on short or quiet chunks
+        segments, _ = model.transcribe(samples, language=WHISPER_LANGUAGE)
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+    except Exception as e:
+        raise sr.RequestError(f"Whisper recognition failed: {str(e)}")
+    if not text:
+        raise sr.UnknownValueError()
+    return text
+
+def get_http_session():
+    """
+    Return the shared HTTP session used for Google recognition requests.
+    Its connection pool is sized for the recognition workers, so each worker
+    keeps a warm keep-alive connection instead of a new TLS handshake per chunk.
+    
+    Returns:
+        requests.Session, or None if requests isn't installed
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            try:
+                import requests
+                from requests.adapters import HTTPAdapter
+            except ImportError:
+                return None
+            adapter = HTTPAdapter(pool_connections=MAX_RECOGNITION_WORKERS, pool_maxsize=MAX_RECOGNITION_WORKERS)
+            _http_session = requests.Session()
+            _http_session.mount("https://", adapter)
+            _http_session.mount("http://", adapter)
+        return _http_session
+
+def create_recognizer():
+    """
+    Create a recognizer whose Google requests go through the shared HTTP session.
+    Requests are built and responses parsed by SpeechRecognition itself, so only
+    the transport changes; the stock recognize_google is used whenever requests
+    or those library internals are unavailable.
+    
+    Returns:
+        Configured sr.Recognizer instance
+    """
+    import speech_recognition as sr
+    
+    class PooledRecognizer(sr.Recognizer):
+        def recognize_google(self, audio_data, key=None, language="en-US", pfilter=0,
+                             show_all=False, with_confidence=False, **kwargs):
+            try:
+                from speech_recognition.recognizers import google
+                google.create_request_builder, google.OutputParser
+            except (ImportError, AttributeError):
+                google = None
+            session = get_http_session()
+            if session is None or google is None or kwargs:
+                return super().recognize_google(audio_data, key=key, language=language, pfilter=pfilter,
+                                                show_all=show_all, with_confidence=with_confidence, **kwargs)
+            
+            # requests is importable here, since the session exists
+            import requests
+            request = google.create_request_builder(
+                endpoint=google.ENDPOINT, key=key, language=language, filter_level=pfilter
+            ).build(audio_data)
+            try:
+                response = session.post(request.full_url, data=request.data,
+                                        headers=dict(request.header_items()),
+                                        timeout=self.operation_timeout)
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                error = sr.RequestError(f"recognition request failed: {e.response.status_code} {e.response.reason}")
+                error.retry_after = e.response.headers.get("Retry-After")
+                raise error
+            except requests.RequestException as e:
+                raise sr.RequestError(f"recognition connection failed: {str(e)}")
+            return google.OutputParser(show_all=show_all, with_confidence=with_confidence).parse(response.text)
+    
+    recognizer = PooledRecognizer()
+    recognizer.energy_threshold = 300
+    recognizer.pause_threshold = 0.8
+    return recognizer
+
+def _recognize_with_retry(recognizer, audio_data, max_attempts=3, base=1.0, cap=30.0):
+    """
+    Call recognize_google, retrying rate-limited requests with exponential backoff.
+    Every attempt first takes a token from REQUEST_BUCKET. A Retry-After delay
+    sent by the server is honored (up to the cap); otherwise delays are jittered
+    so concurrent workers don't retry in lockstep. Any other error is raised
+    immediately.
+    """
+    import speech_recognition as sr
+    
+    for attempt in range(max_attempts):
+        REQUEST_BUCKET.acquire()
+        try:
+            return recognizer.recognize_google(audio_data)
+        except sr.RequestError as e:
+            message = str(e).lower()
+            if attempt == max_attempts - 1 or not any(s in message for s in RETRYABLE_ERRORS):
+                raise
+            delay = base * 2 ** attempt + random.uniform(0, 0.25)
+            try:
+                delay = float(getattr(e, "retry_after", None))
+            except (TypeError, ValueError):
+                pass
+            time.sleep(min(cap, delay))
+
+def _recognize_chunk(recognizer, index, chunk, total, whisper_model=None):
+    """
+    Transcribe a single chunk with redundancy across recognition services.
+    
+    Args:
+        recognizer: Shared, pre-configured sr.Recognizer
+        index: Position of the chunk in the audio
+        chunk: 16 kHz 16-bit mono NumPy sample array to transcribe
+        total: Total number of chunks, for progress messages
+        whisper_model: Shared faster-whisper model to use instead of Google, if loaded
+        
+    Returns:
+        Tuple of (index, text), with empty text if every service failed
+    """
+    import speech_recognition as sr
+    
+    label = f"Chunk {index+1}/{total}"
+    
+    try:
+        # Add silence padding to the chunk to improve recognition accuracy, splicing
+        # the raw 16-bit samples instead of building intermediate AudioSegments
+        audio_data = make_audio_data(CHUNK_PADDING + chunk.tobytes() + CHUNK_PADDING)
+        
+        # Try primary service (local Whisper when available, otherwise Google)
+        try:
+            if whisper_model is not None:
+                text = recognize_whisper_local(whisper_model, audio_data)
+            else:
+                text = _recognize_with_retry(recognizer, audio_data)
+            print(f"{label}: Transcribed successfully")
+            return index, text
+        except sr.UnknownValueError:
+            print(f"{label}: No speech detected with primary recognizer")
+        except sr.RequestError as e:
+            print(f"{label}: Primary recognizer request error: {e}")
+        
+        # If primary failed, try backup services
+        try:
+            # Try Sphinx as offline backup
+            print(f"{label}: Trying backup recognizer...")
+            # Attempt to use recognizer_sphinx if available, otherwise continue with fallback
+            try:
+                text = recognizer.recognize_sphinx(audio_data)
+                print(f"{label}: Backup transcription successful")
+            except (ImportError, AttributeError):
+                # If Sphinx not available, try a second Google attempt, paced
+                # and retried like the primary one
+                text = _recognize_with_retry(recognizer, audio_data)
+                print(f"{label}: Alternative transcription successful")
+            return index, text
+        except Exception as backup_error:
+            print(f"{label}: Backup transcription also failed: {str(backup_error)}")
+    except Exception as chunk_error:
+        print(f"Error processing chunk {index+1}: {str(chunk_error)}")
+    
+    return index, ""
+
+def transcribe_large_audio(audio, min_silence_len=500, silence_thresh=-40):
+    """
+    Split the audio into chunks and apply speech recognition on each chunk.
     Includes redundancy with multiple recognition services and error recovery.
     
     Args:
-        audio_path: Path to the WAV audio file
+        audio: Path to the WAV audio file, or an already decoded 16 kHz 16-bit mono sample array
         min_silence_len: Minimum length of silence (in ms) to be detected as a split point
         silence_thresh: Silence threshold in dBFS
         
     Returns:
         Full transcription text
     """
-    # Load the audio file with error handling
-    print(f"Loading audio file: {audio_path}")
-    try:
-        sound = AudioSegment.from_wav(audio_path)
-    except Exception as e:
-        print(f"Error loading audio file: {str(e)}")
-        # Last resort attempt - try loading with different approach
+    import numpy as np
+    from pydub import AudioSegment
+    
+    # Load the audio file with error handling; the samples come back already
+    # downsampled to 16 kHz mono, which is all the recognizers use
+    if isinstance(audio, np.ndarray):
+        samples = audio
+    else:
+        audio_path = audio
+        print(f"Loading audio file: {audio_path}")
         try:
-            print("Attempting alternative loading method...")
-            sound = AudioSegment.from_file(audio_path)
-            print("Alternative loading successful")
-        except Exception as alt_error:
-            print(f"Alternative loading also failed: {str(alt_error)}")
-            print("Cannot process audio file. Returning empty transcription.")
-            return ""
+            samples = load_wav_samples(audio_path)
+        except Exception as e:
+            print(f"Error loading audio file: {str(e)}")
+            # Last resort attempt - try loading with different approach
+            try:
+                print("Attempting alternative loading method...")
+                samples = audio_segment_to_samples(AudioSegment.from_file(audio_path))
+                print("Alternative loading successful")
+            except Exception as alt_error:
+                print(f"Alternative loading also failed: {str(alt_error)}")
+                print("Cannot process audio file. Returning empty transcription.")
+                return ""
     
     # Try multiple silence detection parameters if initial attempt produces poor results
     print("Splitting audio into chunks based on silence...")
     
     # Primary chunking attempt
-    chunks = split_on_silence(
-        sound,
+    chunks, energy_db = fast_split_on_silence(
+        samples,
         min_silence_len=min_silence_len,
-        silence_thresh=silence_thresh
+        silence_thresh_db=silence_thresh
     )
     
     # If very few chunks detected, try with different parameters
     if len(chunks) < 2:
         print("Few chunks detected. Trying alternative silence parameters...")
-        # Try more aggressive silence detection
-        alt_chunks = split_on_silence(
-            sound,
+        # Try more aggressive silence detection, re-thresholding the energy
+        # computed above rather than scanning the audio again
+        alt_chunks, _ = fast_split_on_silence(
+            samples,
             min_silence_len=300,  # Shorter silence detection
-            silence_thresh=-35    # Less strict silence threshold
+            silence_thresh_db=-35,  # Less strict silence threshold
+            energy_db=energy_db
         )
         
         # Use alternative chunks if they seem better
@@ -220,94 +789,63 @@ def transcribe_large_audio(audio_path, min_silence_len=500, silence_thresh=-40):
             print(f"Using alternative chunking method ({len(alt_chunks)} chunks vs {len(chunks)})")
             chunks = alt_chunks
     
-    # If still no chunks were detected, use fixed-length chunking as final fallback
+    # Skip chunks a local voice activity detector finds no speech in
+    if chunks:
+        speech_chunks = [chunk for chunk in chunks if has_speech(chunk)]
+        if len(speech_chunks) < len(chunks):
+            print(f"Skipping {len(chunks) - len(speech_chunks)} chunks with no speech detected locally")
+            if not speech_chunks:
+                return ""
+            chunks = speech_chunks
+    
+    # Merge short chunks so fewer, longer requests are sent
+    if len(chunks) > 1:
+        merged_chunks = coalesce_chunks(chunks)
+        if len(merged_chunks) < len(chunks):
+            print(f"Merged {len(chunks)} chunks into {len(merged_chunks)} for recognition")
+            chunks = merged_chunks
+    
+    # If still no chunks were detected, use fixed-length chunking as final fallback,
+    # unless the energy scan shows there is no activity at all to transcribe
+    if not chunks and (not len(energy_db) or energy_db.max() < NO_ACTIVITY_THRESH_DBFS):
+        print("No audio activity detected. Returning empty transcription.")
+        return ""
     if not chunks:
         print("No silence detected for splitting. Using fixed-length chunking...")
         # Create 30-second chunks
-        chunk_length_ms = 30000
-        chunks = [sound[i:i+chunk_length_ms] for i in range(0, len(sound), chunk_length_ms)]
-    
-    # Initialize primary and backup recognizers
-    primary_recognizer = sr.Recognizer()
-    backup_recognizer = sr.Recognizer()
+        chunk_length = 30 * TARGET_SAMPLE_RATE
+        chunks = [samples[i:i+chunk_length] for i in range(0, len(samples), chunk_length)]
     
-    # Adjust recognizer parameters for better recognition
-    primary_recognizer.energy_threshold = 300
-    backup_recognizer.energy_threshold = 300
+    if not chunks:
+        return ""
     
-    # Different API settings for backup
-    primary_recognizer.pause_threshold = 0.8
-    backup_recognizer.pause_threshold = 1.0
+    # A single recognizer is configured once and shared by all workers; it holds
+    # no per-request state when recognizing ready-made AudioData
+    recognizer = create_recognizer()
     
-    full_text = ""
-    chunk_files = []
+    # Prefer the offline Whisper model, loaded once before the workers start
+    whisper_model = get_whisper_model()
     
     print(f"Processing {len(chunks)} audio chunks...")
     
-    # Process each chunk with redundancy
-    for i, chunk in enumerate(chunks):
-        # Create a silence chunk for padding
-        silence_chunk = AudioSegment.silent(duration=500)  # 500ms silence
-        
-        # Add padding to the chunk to improve recognition accuracy
-        audio_chunk = silence_chunk + chunk + silence_chunk
-        
-        # Export the chunk to a temporary WAV file
-        chunk_filename = f"temp_chunk_{i}.wav"
-        chunk_files.append(chunk_filename)
-        
-        try:
-            audio_chunk.export(chunk_filename, format="wav")
-            
-            # Primary recognition attempt with Google
-            with sr.AudioFile(chunk_filename) as source:
-                audio_data = primary_recognizer.record(source)
-                success = False
-                
-                # Try primary service (Google)
-                try:
-                    text = primary_recognizer.recognize_google(audio_data)
-                    full_text += text + " "
-                    print(f"Chunk {i+1}/{len(chunks)}: Transcribed successfully")
-                    success = True
-                except sr.UnknownValueError:
-                    print(f"Chunk {i+1}/{len(chunks)}: No speech detected with primary recognizer")
-                except sr.RequestError as e:
-                    print(f"Chunk {i+1}/{len(chunks)}: Primary recognizer request error: {e}")
-                
-                # If primary failed, try backup services
-                if not success:
-                    try:
-                        # Try Sphinx as offline backup
-                        print(f"Chunk {i+1}/{len(chunks)}: Trying backup recognizer...")
-                        # Attempt to use recognizer_sphinx if available, otherwise continue with fallback
-                        try:
-                            # Try to import pocketsphinx only if needed
-                            import speech_recognition as sr_backup
-                            text = backup_recognizer.recognize_sphinx(audio_data)
-                            full_text += text + " "
-                            print(f"Chunk {i+1}/{len(chunks)}: Backup transcription successful")
-                        except (ImportError, AttributeError):
-                            # If Sphinx not available, try second Google attempt with different settings
-                            text = backup_recognizer.recognize_google(audio_data)
-                            full_text += text + " "
-                            print(f"Chunk {i+1}/{len(chunks)}: Alternative transcription successful")
-                    except Exception as backup_error:
-                        print(f"Chunk {i+1}/{len(chunks)}: Backup transcription also failed: {str(backup_error)}")
-        except Exception as chunk_error:
-            print(f"Error processing chunk {i+1}: {str(chunk_error)}")
-    
-    # Clean up all temporary files with error handling
-    for chunk_file in chunk_files:
-        try:
-            if os.path.exists(chunk_file):
-                os.remove(chunk_file)
-        except Exception as e:
-            print(f"Warning: Failed to remove temporary file {chunk_file}: {str(e)}")
+    # Recognition is network-bound, so chunks are dispatched concurrently.
+    # Each worker returns its own (index, text) pair; no state is shared.
+    max_workers = min(MAX_RECOGNITION_WORKERS, len(chunks))
+    # The texts are placed by chunk index into a pre-sized list, so they are
+    # joined in order without sorting or repeated string concatenation.
+    texts = [""] * len(chunks)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for index, text in executor.map(
+            lambda item: _recognize_chunk(recognizer, item[0], item[1], len(chunks), whisper_model),
+            enumerate(chunks)
+        ):
+            texts[index] = text
+    
+    full_text = " ".join(text for text in texts if text)
     
     return full_text.strip()
 
-def transcribe_audio(audio_path, output_path=None):
+def transcribe_audio(audio_path, output_path=None, use_cache=True):
     """
     Main function to handle audio transcription with comprehensive error handling
     and redundancy for robust operation.
@@ -315,23 +853,22 @@ def transcribe_audio(audio_path, output_path=None):
     Args:
         audio_path: Path to the audio file
         output_path: Path where to save the transcription
+        use_cache: Whether to reuse (and store) cached transcriptions
         
     Returns:
         Path to the saved transcription file
     """
     start_time = time.time()
-    temp_files = []
     success = False
     backup_output = False
+    ensure_audio_modules()
     original_output_path = output_path
     
     try:
         # Auto-detect file path if given a directory
         if os.path.isdir(audio_path):
             print(f"Directory provided instead of file. Scanning for audio files...")
-            audio_files = []
-            for extension in ['.wav', '.mp3', '.m4a', '.flac', '.aac', '.ogg']:
-                audio_files.extend(glob.glob(os.path.join(audio_path, f"*{extension}")))
+            audio_files = scan_audio_files(audio_path, {'.wav', '.mp3', '.m4a', '.flac', '.aac', '.ogg'})
             
             if audio_files:
                 print(f"Found {len(audio_files)} audio files. Using the first one: {audio_files[0]}")
@@ -345,16 +882,6 @@ def transcribe_audio(audio_path, output_path=None):
             print(f"Error: {audio_path} is not a valid file.")
             return None
         
-        # Convert to WAV if needed with error handling
-        try:
-            wav_path = convert_to_wav(audio_path)
-            if wav_path != audio_path:
-                temp_files.append(wav_path)
-        except Exception as conv_error:
-            print(f"Warning: Error during conversion: {str(conv_error)}")
-            print("Attempting to process original file...")
-            wav_path = audio_path
-        
         # Default output path
         if not output_path:
             base_name = os.path.splitext(os.path.basename(audio_path))[0]
@@ -366,19 +893,46 @@ def transcribe_audio(audio_path, output_path=None):
             f"audio_transcription_{int(time.time())}.txt"
         )
         
-        # Transcribe the audio
-        print(f"Starting transcription of {wav_path}...")
-        transcription = transcribe_large_audio(wav_path)
+        # Reuse a previous transcription of the same file if one is cached
+        transcription = None
+        content_key = None
+        if use_cache:
+            try:
+                content_key = file_key(audio_path)
+                cache_key = transcription_cache_key(content_key, recognition_backend())
+                transcription = load_cached_transcription(cache_key)
+            except Exception as cache_error:
+                print(f"Warning: Transcription cache unavailable: {str(cache_error)}")
         
-        # Check if transcription is empty and run recovery if needed
-        if not transcription.strip():
-            print("Warning: Empty transcription detected. Trying alternative settings...")
-            # Try again with different parameters
-            transcription = transcribe_large_audio(wav_path, min_silence_len=300, silence_thresh=-35)
+        if transcription is not None:
+            print(f"Using cached transcription of {audio_path}")
+        else:
+            # Decode into memory if needed with error handling
+            try:
+                audio = decode_audio(audio_path)
+            except Exception as conv_error:
+                print(f"Warning: Error during decoding: {str(conv_error)}")
+                print("Attempting to process original file...")
+                audio = audio_path
+            
+            # Transcribe the audio
+            print(f"Starting transcription of {audio_path}...")
+            transcription = transcribe_large_audio(audio)
+            
+            # Check if transcription is empty and run recovery if needed
+            if not transcription.strip():
+                print("Warning: Empty transcription detected. Trying alternative settings...")
+                # Try again with different parameters
+                transcription = transcribe_large_audio(audio, min_silence_len=300, silence_thresh=-35)
+            
+            # Only cache real results so transient failures are retried next time.
+            # The backend is looked up again because Whisper may have failed to load.
+            if content_key and transcription.strip():
+                save_cached_transcription(transcription_cache_key(content_key, recognition_backend()), transcription)
         
         # Save the transcription with error handling
         try:
-            with open(output_path, "w") as file:
+            with open(output_path, "w", encoding="utf-8") as file:
                 file.write(transcription)
             print(f"Transcription saved to: {output_path}")
             success = True
@@ -387,7 +941,7 @@ def transcribe_audio(audio_path, output_path=None):
             print(f"Trying backup location: {backup_output_path}")
             
             try:
-                with open(backup_output_path, "w") as backup_file:
+                with open(backup_output_path, "w", encoding="utf-8") as backup_file:
                     backup_file.write(transcription)
                 print(f"Transcription saved to backup location: {backup_output_path}")
                 output_path = backup_output_path
@@ -402,14 +956,6 @@ def transcribe_audio(audio_path, output_path=None):
                 print("\n--- END TRANSCRIPTION ---\n")
                 print("Transcription could not be saved to file, but is displayed above.")
         
-        # Clean up temporary files with error handling
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception as cleanup_error:
-                print(f"Warning: Could not remove temporary file {temp_file}: {str(cleanup_error)}")
-        
         elapsed_time = time.time() - start_time
         print(f"Transcription completed in {elapsed_time:.2f} seconds!")
         
@@ -431,64 +977,146 @@ def transcribe_audio(audio_path, output_path=None):
         import traceback
         traceback.print_exc()
         
-        # Clean up any temporary files
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except:
-                pass
-        
         return None
 
-def auto_detect_audio_files():
+def _init_batch_worker(recognition_workers, requests_per_second):
+    """Give each batch process its share of the recognition thread and request rate budgets."""
+    global MAX_RECOGNITION_WORKERS, REQUEST_BUCKET
+    MAX_RECOGNITION_WORKERS = recognition_workers
+    REQUEST_BUCKET = TokenBucket(requests_per_second, recognition_workers)
+
+def _transcribe_one(audio_path, use_cache=True):
+    """Transcribe a single file inside a batch worker process."""
+    return transcribe_audio(audio_path, use_cache=use_cache)
+
+def transcribe_batch(audio_files, use_cache=True):
     """
-    Automatically scan the current directory for audio files.
+    Transcribe several audio files in parallel, one worker process per file.
+    Processes are used rather than threads because decoding and silence
+    detection are CPU-bound and hold the GIL for long stretches. The
+    MAX_RECOGNITION_WORKERS recognition threads and the Google request rate
+    are shared out between the processes, and Whisper batches use a single
+    process so only one model is loaded (and only one process claims the GPU).
+    
+    Args:
+        audio_files: List of paths to the audio files
+        use_cache: Whether to reuse (and store) cached transcriptions
+        
+    Returns:
+        List of saved transcription paths (None for files that failed)
+    """
+    max_workers = min(os.cpu_count() or 1, len(audio_files))
+    if recognition_backend() != "google":
+        max_workers = min(max_workers, WHISPER_BATCH_WORKERS)
+    recognition_workers = max(1, MAX_RECOGNITION_WORKERS // max_workers)
+    print(f"Batch processing {len(audio_files)} audio files with {max_workers} workers...")
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker,
+                             initargs=(recognition_workers, REQUESTS_PER_SECOND / max_workers)) as executor:
+        results = list(executor.map(_transcribe_one, audio_files, [use_cache] * len(audio_files)))
+    
+    succeeded = sum(1 for result in results if result)
+    print(f"Batch complete: {succeeded}/{len(audio_files)} files transcribed successfully.")
+    return results
+
+def scan_audio_files(directory, extensions):
+    """
+    List the files in a directory whose extension is in the given set.
+    Uses a single os.scandir pass instead of one glob per extension. Hidden
+    files (such as macOS ._ AppleDouble files) are skipped, as glob does.
+    """
+    return sorted(
+        entry.path for entry in os.scandir(directory)
+        if not entry.name.startswith(".") and entry.is_file()
+        and os.path.splitext(entry.name)[1].lower() in extensions
+    )
+
+def auto_detect_audio_files(directory="."):
+    """
+    Automatically scan a directory (the current one by default) for audio files.
     Returns a list of audio files found.
     """
     # Common audio file extensions
-    extensions = ['.wav', '.mp3', '.m4a', '.flac', '.aac', '.ogg', '.wma', '.mp4', '.avi', '.mov']
-    
-    audio_files = []
-    for ext in extensions:
-        audio_files.extend(glob.glob(f"*{ext}"))
-    
-    return audio_files
+    extensions = {'.wav', '.mp3', '.m4a', '.flac', '.aac', '.ogg', '.wma', '.mp4', '.avi', '.mov'}
+    return scan_audio_files(directory, extensions)
 
-def save_config(config):
-    """Save configuration to a JSON file."""
-    config_dir = os.path.join(os.path.expanduser("~"), ".audio_transcriber")
-    os.makedirs(config_dir, exist_ok=True)
-    
-    config_path = os.path.join(config_dir, "config.json")
-    with open(config_path, "w") as f:
-        json.dump(config, f)
+def get_cache_dir():
+    """Return the transcription cache directory, creating it if needed."""
+    cache_dir = os.path.join(os.path.expanduser("~"), ".audio_transcriber", "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def file_key(path):
+    """
+    Hash a file for use in cache keys, in bounded memory regardless of its size.
+    The file size is hashed first so files of different lengths can never
+    collide, then the contents are streamed through a reused 1 MiB buffer.
+    Uses BLAKE3 (SIMD and multithreaded) when installed, then xxHash, and falls
+    back to hashlib's blake2b. The algorithm name prefixes the digest so keys
+    from different backends never collide.
+    """
+    try:
+        import blake3
+        algorithm, hasher = "blake3", blake3.blake3(max_threads=blake3.blake3.AUTO)
+    except ImportError:
+        try:
+            import xxhash
+            algorithm, hasher = "xxh3", xxhash.xxh3_128()
+        except ImportError:
+            algorithm, hasher = "blake2b", hashlib.blake2b(digest_size=16)
     
-def load_config():
-    """Load configuration from a JSON file."""
-    config_dir = os.path.join(os.path.expanduser("~"), ".audio_transcriber")
-    config_path = os.path.join(config_dir, "config.json")
+    hasher.update(os.stat(path).st_size.to_bytes(8, "little"))
+    buffer = bytearray(1 << 20)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
     
-    default_config = {
-        "last_used_dir": os.path.expanduser("~"),
-        "default_output_dir": os.path.expanduser("~"),
-        "auto_detect_files": True,
-        "auto_install_deps": True
-    }
+    digest = hasher.hexdigest(16) if algorithm == "blake3" else hasher.hexdigest()
+    return f"{algorithm}-{digest}"
+
+def transcription_cache_key(content_key, backend, min_silence_len=500, silence_thresh=-40):
+    """
+    Build a cache key from the audio content and the settings that affect the result.
+    Only the content is hashed, so copies, re-downloads or touched files of the
+    same audio still hit the cache, while any edit changes the key.
     
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            # Merge with defaults for any missing keys
-            for key, value in default_config.items():
-                if key not in config:
-                    config[key] = value
-            return config
-        except Exception:
-            return default_config
-    else:
-        return default_config
+    Args:
+        content_key: Content digest of the audio file (see file_key)
+        backend: Recognition backend name (see recognition_backend)
+    """
+    key_material = (f"{content_key}:{backend}:"
+                    f"{min_silence_len}:{silence_thresh}:{TARGET_SAMPLE_RATE}")
+    return hashlib.blake2b(key_material.encode(), digest_size=16).hexdigest()
+
+def load_cached_transcription(cache_key):
+    """Return the cached transcription for a key, or None if there isn't one."""
+    cache_path = os.path.join(get_cache_dir(), f"{cache_key}.txt")
+    if not os.path.exists(cache_path):
+        return None
+    with open(cache_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def save_cached_transcription(cache_key, transcription):
+    """Store a transcription in the cache, ignoring failures."""
+    temp_path = None
+    try:
+        cache_path = os.path.join(get_cache_dir(), f"{cache_key}.txt")
+        # Write to a temporary file first so concurrent batch workers never see partial results
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(transcription)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Could not cache transcription: {str(e)}")
+        # Don't leave a partial temporary file behind in the cache
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
 
 def main():
     """Main function to parse arguments and handle the audio transcription process."""
@@ -500,22 +1128,58 @@ def main():
     parser.add_argument("-o", "--output", help="Path where to save the transcription")
     parser.add_argument("--install-deps", action="store_true", help="Check and install dependencies")
     parser.add_argument("--scan-dir", help="Scan directory for audio files")
-    parser.add_argument("--batch", action="store_true", help="Process all audio files in the current directory")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached transcriptions and transcribe from scratch")
+    parser.add_argument("--batch", action="store_true", help="Process all audio files in the current directory (or --scan-dir) in parallel")
     
     args = parser.parse_args()
     
     # Auto-install dependencies by default unless explicitly disabled
     if config["auto_install_deps"] and not args.install_deps:
         print("Performing automatic dependency check...")
-        check_dependencies()
+        check_dependencies(config)
     # Manual dependency check
     elif args.install_deps:
-        check_dependencies()
+        check_dependencies(config)
         print("Dependencies check complete.")
         return
     
     # Handle directory scanning
+    scan_dir = "."
     if args.scan_dir:
+        if not os.path.isdir(args.scan_dir):
+            print(f"Error: {args.scan_dir} is not a valid directory.")
+            return
+        scan_dir = args.scan_dir
+        config["last_used_dir"] = os.path.abspath(scan_dir)
+        save_config(config)
+    
+    # Batch mode: transcribe every audio file found, in parallel
+    if args.batch:
+        audio_files = auto_detect_audio_files(scan_dir)
+        if not audio_files:
+            print(f"No audio files found in {os.path.abspath(scan_dir)}")
+            return
+        transcribe_batch(audio_files, use_cache=not args.no_cache)
+        return
+    
+    # Single file provided on the command line
+    if args.audio_path:
+        transcribe_audio(args.audio_path, args.output, use_cache=not args.no_cache)
+        return
+    
+    # Otherwise fall back to auto-detecting a file to transcribe
+    if args.scan_dir or config["auto_detect_files"]:
+        audio_files = auto_detect_audio_files(scan_dir)
+        if audio_files:
+            print(f"Found {len(audio_files)} audio files:")
+            for audio_file in audio_files:
+                print(f"  {audio_file}")
+            print(f"Transcribing the first one: {audio_files[0]}")
+            transcribe_audio(audio_files[0], args.output, use_cache=not args.no_cache)
+            return
+        print(f"No audio files found in {os.path.abspath(scan_dir)}")
+    
+    parser.print_help()
 
 if __name__ == "__main__":
     try:
@@ -10,52 +10,161 @@ import sys
 import platform
 import subprocess
 import time
+import hashlib
+import importlib.util
+import shutil
+import random
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, ttk
 from tkinter.scrolledtext import ScrolledText
 import traceback
+import wave
+import mmap
+
+# Maximum number of recognition requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+_request_semaphore = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Speech recognizers work on 16 kHz mono audio, so everything is decoded to it up front
+TARGET_SAMPLE_RATE = 16000
+
+# 500 ms of 16-bit silence added before and after each chunk
+CHUNK_PADDING = b"\x00" * (TARGET_SAMPLE_RATE // 2 * 2)
+
+# Decoded audio and finished transcriptions are cached here, keyed by content hash
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "audio_transcriber")
+
+# Decoded audio (about 115 MB per hour) is kept to this many bytes in total,
+# removing the least recently used files first
+DECODED_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# Marker recording a successful dependency check, trusted for this long (in seconds)
+DEPS_MARKER = os.path.join(CACHE_DIR, "deps_ok")
+DEPS_MARKER_MAX_AGE = 7 * 24 * 60 * 60
+
+# Audio whose speech fits in this many ms (with a pause between phrases) is sent as one request
+SINGLE_PASS_MAX_MS = 50000
+
+# Silence kept (in ms) around each phrase when the audio is split into chunks
+KEEP_SILENCE_MS = 100
+
+# Optional local voice activity detection (webrtcvad): chunks with fewer than
+# VAD_MIN_SPEECH_FRAMES speech frames are not sent for recognition
+VAD_AGGRESSIVENESS = 2
+VAD_FRAME_MS = 30
+VAD_MIN_SPEECH_FRAMES = 3
+
+# Google requests are paced to stay just under the service's rate limit
+REQUESTS_PER_SECOND = 5
+REQUEST_BURST = MAX_CONCURRENT_REQUESTS
+
+# Substrings of recognition errors caused by rate limiting, which are worth retrying
+RETRYABLE_ERRORS = ("429", "too many requests", "quota", "rate")
+
+# How often (in ms) queued status messages are written to the log
+LOG_REFRESH_MS = 100
+
+# One recognizer per worker thread, so no recognizer state is shared between requests
+_thread_local = threading.local()
+
+# Shared keep-alive HTTP session for recognition requests, created on first use
+_http_session = None
+_http_session_lock = threading.Lock()
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    Allows bursts of up to `burst` requests, then paces them at `rate` per second.
+    """
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                needed = 1 - self.tokens
+            time.sleep(needed / self.rate)
+
+REQUEST_BUCKET = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+
+def import_libraries():
+    """Import the audio processing libraries into the module namespace."""
+    global sr, AudioSegment, np
+    import speech_recognition as sr
+    from pydub import AudioSegment
+    import numpy as np
+
+def deps_marker_valid():
+    """Check for a recent dependency-check marker written by this Python interpreter."""
+    try:
+        if time.time() - os.path.getmtime(DEPS_MARKER) > DEPS_MARKER_MAX_AGE:
+            return False
+        with open(DEPS_MARKER, "r") as f:
+            return f.read() == sys.executable
+    except OSError:
+        return False
 
 # Function to check and install dependencies
 def check_dependencies(status_callback=None):
-    """Check and install required dependencies based on OS detection."""
+    """
+    Check and install required dependencies based on OS detection.
+    A successful check is recorded in a marker file, so later launches skip
+    straight to importing the libraries until the marker goes stale.
+    """
+    if deps_marker_valid():
+        try:
+            import_libraries()
+            if status_callback:
+                status_callback("Dependencies already verified.")
+            return True
+        except ImportError:
+            pass
+    
     if status_callback:
         status_callback("Checking system dependencies...")
     
     system = platform.system().lower()
     
-    # Check if pip is installed
+    # Only install Python dependencies if they can't already be imported
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "--version"], 
-                            stdout=subprocess.DEVNULL, 
-                            stderr=subprocess.DEVNULL)
-    except subprocess.CalledProcessError:
-        if status_callback:
-            status_callback("Error: pip is not installed. Please install pip first.")
-        return False
-    
-    # Install Python dependencies
-    if status_callback:
-        status_callback("Installing required Python packages...")
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "SpeechRecognition", "pydub"])
-    except subprocess.CalledProcessError:
+        import_libraries()
+    except ImportError:
+        # Check if pip is installed (a module lookup, without starting another interpreter)
+        if importlib.util.find_spec("pip") is None:
+            if status_callback:
+                status_callback("Error: pip is not installed. Please install pip first.")
+            return False
+        
+        # Install Python dependencies
         if status_callback:
-            status_callback("Error installing Python dependencies. Please install manually.")
-        return False
+            status_callback("Installing required Python packages...")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "SpeechRecognition", "pydub", "numpy", "requests"])
+        except subprocess.CalledProcessError:
+            if status_callback:
+                status_callback("Error installing Python dependencies. Please install manually.")
+            return False
     
     # Check and install ffmpeg based on OS
     if status_callback:
         status_callback("Checking for FFmpeg...")
     
-    ffmpeg_installed = False
-    try:
-        subprocess.check_call(["ffmpeg", "-version"], 
-                            stdout=subprocess.DEVNULL, 
-                            stderr=subprocess.DEVNULL)
-        ffmpeg_installed = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        ffmpeg_installed = False
+    # A PATH lookup is much cheaper than spawning ffmpeg to see if it runs
+    ffmpeg_installed = shutil.which("ffmpeg") is not None
     
     if not ffmpeg_installed:
         if status_callback:
@@ -82,14 +191,11 @@ def check_dependencies(status_callback=None):
                 return False
         elif system == "darwin":
             # macOS - try to use Homebrew
-            try:
-                subprocess.check_call(["brew", "--version"], 
-                                    stdout=subprocess.DEVNULL, 
-                                    stderr=subprocess.DEVNULL)
+            if shutil.which("brew"):
                 if status_callback:
                     status_callback("Installing FFmpeg via Homebrew...")
                 subprocess.call(["brew", "install", "ffmpeg"])
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            else:
                 if status_callback:
                     status_callback("Homebrew not found. Please install Homebrew and then FFmpeg manually.")
                 return False
@@ -105,127 +211,443 @@ def check_dependencies(status_callback=None):
     
     # Try loading the libraries
     try:
-        global sr, AudioSegment, split_on_silence
-        import speech_recognition as sr
-        from pydub import AudioSegment
-        from pydub.silence import split_on_silence
+        import_libraries()
         if status_callback:
             status_callback("All dependencies installed successfully!")
-        return True
     except ImportError as e:
         if status_callback:
             status_callback(f"Error loading Python libraries: {str(e)}")
         return False
+    
+    # Remember the successful check for later launches
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DEPS_MARKER, "w") as f:
+            f.write(sys.executable)
+    except OSError:
+        pass
+    return True
+
+# Cache helpers
+def file_digest(path):
+    """Return the SHA-1 hex digest of a file's contents, read in 1 MiB blocks."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def cache_path(digest, extension):
+    """Return the cache file path for a content digest, creating the cache directory."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, f"{digest}{extension}")
+
+def write_cache_file(path, write):
+    """Write a cache file atomically: write(tmp_path) fills a temporary file that is then moved into place."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 # Audio processing functions
-def convert_to_wav(audio_path, status_callback=None):
-    """Convert audio file to WAV format if it's not already."""
-    if audio_path.endswith('.wav'):
-        return audio_path
+def _try_fast_wav_load(audio_path):
+    """
+    Memory-map the samples of a WAV file that is already 16 kHz 16-bit mono.
     
-    filename = os.path.splitext(os.path.basename(audio_path))[0]
-    output_path = f"{filename}_converted.wav"
+    Returns:
+        Read-only NumPy int16 array backed by the file, or None if the file
+        needs decoding
+    """
+    try:
+        with open(audio_path, "rb") as f:
+            with wave.open(f) as wav_file:
+                params = wav_file.getparams()
+                # The reader stops at the start of the sample data
+                offset = f.tell()
+            if (params.nchannels, params.sampwidth, params.framerate) != (1, 2, TARGET_SAMPLE_RATE) \
+                    or not params.nframes:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (wave.Error, EOFError, OSError, ValueError):
+        return None
+    count = min(params.nframes, (len(mapped) - offset) // 2)
+    return np.frombuffer(mapped, dtype=np.int16, count=count, offset=offset)
+
+def prune_decoded_cache(keep=None):
+    """Remove the least recently used decoded audio until the cache fits in DECODED_CACHE_MAX_BYTES."""
+    try:
+        entries = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith(".npy") and entry.is_file()]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    total = 0
+    for entry in entries:
+        try:
+            total += entry.stat().st_size
+            if total > DECODED_CACHE_MAX_BYTES and entry.path != keep:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def load_pcm_mono16k(audio_path, status_callback=None, digest=None):
+    """
+    Decode an audio file into a 16 kHz 16-bit mono NumPy sample array.
+    WAV files that are already in that format are memory-mapped directly.
+    Otherwise ffmpeg's raw PCM output is piped straight into memory, so no
+    intermediate WAV file is written. Decoded non-WAV files are cached by
+    content hash, so re-transcribing the same audio skips ffmpeg; the cache
+    is capped at DECODED_CACHE_MAX_BYTES.
+    """
+    cached_samples = None
+    if os.path.splitext(audio_path)[1].lower() == '.wav':
+        samples = _try_fast_wav_load(audio_path)
+        if samples is not None:
+            if status_callback:
+                status_callback(f"Loaded {len(samples) / TARGET_SAMPLE_RATE:.1f} seconds of 16 kHz mono audio")
+            return samples
+    else:
+        cached_samples = cache_path(digest or file_digest(audio_path), ".npy")
+        if os.path.exists(cached_samples):
+            if status_callback:
+                status_callback(f"Using cached decoded audio: {cached_samples}")
+            # Mark the file as recently used so pruning keeps it
+            os.utime(cached_samples)
+            return np.load(cached_samples, mmap_mode="r")
     
     if status_callback:
-        status_callback(f"Converting {audio_path} to WAV format...")
+        status_callback(f"Decoding {audio_path}...")
     
-    audio = AudioSegment.from_file(audio_path)
-    audio.export(output_path, format="wav")
+    try:
+        process = subprocess.Popen(
+            ["ffmpeg", "-nostdin", "-i", audio_path, "-vn", "-f", "s16le", "-acodec", "pcm_s16le",
+             "-ac", "1", "-ar", str(TARGET_SAMPLE_RATE), "pipe:1"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20  # Large pipe buffer to avoid syscall thrash on big payloads
+        )
+        with process.stdout:
+            raw = process.stdout.read()
+        if process.wait() != 0 or not raw:
+            raise Exception(f"ffmpeg exited with status {process.returncode}")
+    except Exception as e:
+        # Fall back to pydub if ffmpeg can't be run directly
+        if status_callback:
+            status_callback(f"Direct decoding failed ({str(e)}). Trying pydub...")
+        sound = AudioSegment.from_file(audio_path)
+        raw = sound.set_frame_rate(TARGET_SAMPLE_RATE).set_channels(1).set_sample_width(2).raw_data
+    samples = np.frombuffer(raw, dtype=np.int16)
+    
+    if cached_samples:
+        def write_samples(tmp_path):
+            with open(tmp_path, "wb") as f:
+                np.save(f, samples)
+        write_cache_file(cached_samples, write_samples)
+        prune_decoded_cache(keep=cached_samples)
     
     if status_callback:
-        status_callback(f"Conversion complete: {output_path}")
+        status_callback(f"Decoding complete: {len(samples) / TARGET_SAMPLE_RATE:.1f} seconds of audio")
     
-    return output_path
+    return samples
 
-def transcribe_large_audio(audio_path, status_callback=None, min_silence_len=500, silence_thresh=-40):
+def get_http_session():
     """
-    Split the audio file into chunks and apply speech recognition on each chunk.
+    Return the shared HTTP session used for Google recognition requests.
+    Its connection pool is sized for the worker threads, so each one keeps a
+    warm keep-alive connection instead of a new TLS handshake per chunk.
+    
+    Returns:
+        requests.Session, or None if requests isn't installed
     """
-    # Load the audio file
-    if status_callback:
-        status_callback(f"Loading audio file: {audio_path}")
-    sound = AudioSegment.from_wav(audio_path)
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            try:
+                import requests
+                from requests.adapters import HTTPAdapter
+            except ImportError:
+                return None
+            adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_REQUESTS, pool_maxsize=MAX_CONCURRENT_REQUESTS)
+            _http_session = requests.Session()
+            _http_session.mount("https://", adapter)
+            _http_session.mount("http://", adapter)
+        return _http_session
+
+def create_recognizer():
+    """
+    Create a recognizer whose Google requests go through the shared HTTP session.
+    Requests are built and responses parsed by SpeechRecognition itself, so only
+    the transport changes; the stock recognize_google is used whenever requests
+    or those library internals are unavailable.
+    """
+    class PooledRecognizer(sr.Recognizer):
+        def recognize_google(self, audio_data, key=None, language="en-US", pfilter=0,
+                             show_all=False, with_confidence=False, **kwargs):
+            try:
+                from speech_recognition.recognizers import google
+                google.create_request_builder, google.OutputParser
+            except (ImportError, AttributeError):
+                google = None
+            session = get_http_session()
+            if session is None or google is None or kwargs:
+                return super().recognize_google(audio_data, key=key, language=language, pfilter=pfilter,
+                                                show_all=show_all, with_confidence=with_confidence, **kwargs)
+            
+            # requests is importable here, since the session exists
+            import requests
+            request = google.create_request_builder(
+                endpoint=google.ENDPOINT, key=key, language=language, filter_level=pfilter
+            ).build(audio_data)
+            try:
+                response = session.post(request.full_url, data=request.data,
+                                        headers=dict(request.header_items()),
+                                        timeout=self.operation_timeout)
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                error = sr.RequestError(f"recognition request failed: {e.response.status_code} {e.response.reason}")
+                error.retry_after = e.response.headers.get("Retry-After")
+                raise error
+            except requests.RequestException as e:
+                raise sr.RequestError(f"recognition connection failed: {str(e)}")
+            return google.OutputParser(show_all=show_all, with_confidence=with_confidence).parse(response.text)
+    
+    return PooledRecognizer()
+
+def get_recognizer():
+    """Return the recognizer belonging to the current worker thread."""
+    if not hasattr(_thread_local, "recognizer"):
+        _thread_local.recognizer = create_recognizer()
+    return _thread_local.recognizer
+
+def _recognize_with_retry(recognizer, audio_data, max_attempts=3, base=1.0, cap=30.0):
+    """
+    Call recognize_google, retrying rate-limited requests with exponential backoff.
+    Every attempt first takes a token from REQUEST_BUCKET. A Retry-After delay
+    sent by the server is honored (up to the cap); otherwise delays are jittered
+    so concurrent workers don't retry in lockstep. Any other error is raised
+    immediately.
+    """
+    for attempt in range(max_attempts):
+        REQUEST_BUCKET.acquire()
+        try:
+            with _request_semaphore:
+                return recognizer.recognize_google(audio_data)
+        except sr.RequestError as e:
+            message = str(e).lower()
+            if attempt == max_attempts - 1 or not any(s in message for s in RETRYABLE_ERRORS):
+                raise
+            delay = base * 2 ** attempt + random.uniform(0, 0.25)
+            try:
+                delay = float(getattr(e, "retry_after", None))
+            except (TypeError, ValueError):
+                pass
+            time.sleep(min(cap, delay))
+
+def _recognize_chunk(i, chunk, total, status_callback=None):
+    """
+    Transcribe a single chunk of samples, returning an empty string if it fails.
+    Runs in a worker thread; the semaphore caps concurrent Google requests.
+    """
+    recognizer = get_recognizer()
     
-    # Split audio where silence is detected
+    # Add silence padding to the chunk to improve recognition accuracy, splicing
+    # the raw samples straight into AudioData with no WAV container
+    audio_data = sr.AudioData(b"".join((CHUNK_PADDING, chunk.tobytes(), CHUNK_PADDING)), TARGET_SAMPLE_RATE, 2)
+    try:
+        text = _recognize_with_retry(recognizer, audio_data)
+        if status_callback:
+            status_callback(f"Chunk {i+1}/{total}: Transcribed successfully")
+        return text
+    except sr.UnknownValueError:
+        if status_callback:
+            status_callback(f"Chunk {i+1}/{total}: No speech detected")
+    except sr.RequestError as e:
+        if status_callback:
+            status_callback(f"Chunk {i+1}/{total}: Could not request results; {e}")
+    return ""
+
+def detect_speech_ranges(samples, min_silence_len=500, silence_thresh=-40, window_ms=10):
+    """
+    Find the non-silent stretches of 16 kHz 16-bit mono audio, like pydub's detect_nonsilent.
+    The RMS level of every window_ms frame is computed with vectorized NumPy,
+    and runs of silent frames at least min_silence_len long split the audio.
+    
+    Returns:
+        List of [start_ms, end_ms] ranges
+    """
+    frame_len = int(TARGET_SAMPLE_RATE * window_ms / 1000)
+    frame_count = len(samples) // frame_len
+    duration_ms = len(samples) * 1000 // TARGET_SAMPLE_RATE
+    
+    # Mean-square level of each frame, computed a block of frames at a time so
+    # the float32 temporaries stay a few MB instead of a copy of the whole
+    # (possibly memory-mapped) recording
+    mean_square = np.empty(frame_count, dtype=np.float32)
+    block = 1 << 13
+    for start in range(0, frame_count, block):
+        stop = min(start + block, frame_count)
+        frames = samples[start * frame_len:stop * frame_len].reshape(stop - start, frame_len).astype(np.float32)
+        frames *= frames
+        frames.mean(axis=1, out=mean_square[start:stop])
+    rms = np.sqrt(mean_square) / 32768
+    silent = 20 * np.log10(rms + 1e-10) < silence_thresh
+    
+    # Run-length encode the silent frames and keep the runs that are long enough
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], silent.astype(np.int8), [0]))))
+    run_starts, run_ends = edges[::2], edges[1::2]
+    long_runs = (run_ends - run_starts) * window_ms >= min_silence_len
+    run_starts = run_starts[long_runs] * window_ms
+    # A silent run reaching the last whole frame also covers the leftover partial frame
+    run_ends = np.where(run_ends[long_runs] == frame_count, duration_ms, run_ends[long_runs] * window_ms)
+    
+    # Speech is whatever lies between the silent runs
+    return [[int(start), int(end)]
+            for start, end in zip(np.concatenate(([0], run_ends)), np.concatenate((run_starts, [duration_ms])))
+            if end > start]
+
+def has_speech(samples):
+    """
+    Return False if WebRTC VAD classes fewer than VAD_MIN_SPEECH_FRAMES of the
+    chunk's 30 ms frames as speech, so the chunk needn't be sent for recognition.
+    Always True when webrtcvad isn't installed.
+    """
+    try:
+        import webrtcvad
+    except ImportError:
+        return True
+    
+    vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+    raw = samples.tobytes()
+    frame_bytes = TARGET_SAMPLE_RATE * VAD_FRAME_MS // 1000 * 2
+    speech_frames = 0
+    for start in range(0, len(raw) - frame_bytes + 1, frame_bytes):
+        if vad.is_speech(raw[start:start + frame_bytes], TARGET_SAMPLE_RATE):
+            speech_frames += 1
+            if speech_frames >= VAD_MIN_SPEECH_FRAMES:
+                return True
+    return False
+
+def transcribe_large_audio(samples, status_callback=None, min_silence_len=500, silence_thresh=-40,
+                           output_fh=None):
+    """
+    Apply speech recognition to 16 kHz 16-bit mono samples, trimming out long silences.
+    Audio with little enough speech is stitched together and sent as a single
+    request; longer audio is split into chunks at the silences, which are
+    recognized concurrently. If output_fh is given, each chunk's text is
+    written to it in order as soon as it's available, so partial results
+    survive a crash.
+    """
+    # Find the stretches of speech between silences
     if status_callback:
-        status_callback("Splitting audio into chunks based on silence...")
-    chunks = split_on_silence(
-        sound,
+        status_callback("Detecting silence in audio...")
+    speech_ranges = detect_speech_ranges(
+        samples,
         min_silence_len=min_silence_len,
         silence_thresh=silence_thresh
     )
     
-    # If no chunks were detected (continuous speech), use the whole audio
-    if not chunks:
+    def to_index(ms):
+        return ms * TARGET_SAMPLE_RATE // 1000
+    
+    # Keep KEEP_SILENCE_MS of context around each stretch of speech so quiet word
+    # starts and endings aren't clipped, without reaching past the midpoint of
+    # the silence shared with the neighbouring stretch
+    duration_ms = len(samples) * 1000 // TARGET_SAMPLE_RATE
+    padded_ranges = []
+    for k, (start, end) in enumerate(speech_ranges):
+        lower = (speech_ranges[k - 1][1] + start) // 2 if k else 0
+        upper = (end + speech_ranges[k + 1][0]) // 2 if k + 1 < len(speech_ranges) else duration_ms
+        padded_ranges.append((max(lower, start - KEEP_SILENCE_MS), min(upper, end + KEEP_SILENCE_MS)))
+    
+    speech_ms = sum(end - start for start, end in padded_ranges) + 500 * (len(padded_ranges) - 1)
+    if not speech_ranges:
+        # If no speech ranges were detected, use the whole audio
         if status_callback:
             status_callback("No silence detected for splitting. Processing entire audio...")
-        chunks = [sound]
+        chunks = [samples]
+    elif speech_ms <= SINGLE_PASS_MAX_MS:
+        # Short enough for one request: stitch the speech together, replacing
+        # each silence with a fixed 500 ms pause
+        if status_callback:
+            status_callback("Trimming silence and transcribing in a single pass...")
+        pause = np.frombuffer(CHUNK_PADDING, dtype=np.int16)
+        pieces = []
+        for start, end in padded_ranges:
+            if pieces:
+                pieces.append(pause)
+            pieces.append(samples[to_index(start):to_index(end)])
+        chunks = [np.concatenate(pieces)]
+    else:
+        # Split audio where silence was detected
+        if status_callback:
+            status_callback("Splitting audio into chunks based on silence...")
+        chunks = [samples[to_index(start):to_index(end)] for start, end in padded_ranges]
     
-    # Initialize recognizer
-    recognizer = sr.Recognizer()
-    full_text = ""
+    # Skip chunks a local voice activity detector finds no speech in
+    speech_chunks = [chunk for chunk in chunks if has_speech(chunk)]
+    if len(speech_chunks) < len(chunks):
+        if status_callback:
+            status_callback(f"Skipping {len(chunks) - len(speech_chunks)} chunks with no speech detected locally")
+        chunks = speech_chunks
     
     if status_callback:
         status_callback(f"Processing {len(chunks)} audio chunks...")
     
-    # Process each chunk
-    for i, chunk in enumerate(chunks):
-        # Create a silence chunk for padding
-        silence_chunk = AudioSegment.silent(duration=500)  # 500ms silence
-        
-        # Add padding to the chunk to improve recognition accuracy
-        audio_chunk = silence_chunk + chunk + silence_chunk
-        
-        # Export the chunk to a temporary WAV file
-        chunk_filename = f"temp_chunk_{i}.wav"
-        audio_chunk.export(chunk_filename, format="wav")
-        
-        # Use the recognizer to transcribe the chunk
-        with sr.AudioFile(chunk_filename) as source:
-            audio_data = recognizer.record(source)
-            try:
-                text = recognizer.recognize_google(audio_data)
-                full_text += text + " "
-                if status_callback:
-                    status_callback(f"Chunk {i+1}/{len(chunks)}: Transcribed successfully")
-            except sr.UnknownValueError:
-                if status_callback:
-                    status_callback(f"Chunk {i+1}/{len(chunks)}: No speech detected")
-            except sr.RequestError as e:
-                if status_callback:
-                    status_callback(f"Chunk {i+1}/{len(chunks)}: Could not request results; {e}")
-        
-        # Remove the temporary file
-        os.remove(chunk_filename)
-    
+    # Recognition is network-bound, so chunks are transcribed concurrently and
+    # the results collected by chunk index to keep the text in order
+    results = [""] * len(chunks)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        futures = [executor.submit(_recognize_chunk, i, chunk, len(chunks), status_callback)
+                   for i, chunk in enumerate(chunks)]
+        written = False
+        for i, future in enumerate(futures):
+            results[i] = future.result()
+            if output_fh and results[i]:
+                output_fh.write(" " + results[i] if written else results[i])
+                output_fh.flush()
+                written = True
+    
+    full_text = " ".join(filter(None, results))
     return full_text.strip()
 
-def transcribe_audio(audio_path, output_path=None, status_callback=None):
+def transcribe_audio(audio_path, output_path=None, status_callback=None, cache_regenerate=False):
     """
     Main function to handle audio transcription.
+    Finished transcriptions are cached by content hash and reused on later runs
+    unless cache_regenerate is set.
     """
     start_time = time.time()
     
-    # Convert to WAV if needed
-    wav_path = convert_to_wav(audio_path, status_callback)
-    
     # Default output path
     if not output_path:
         base_name = os.path.splitext(os.path.basename(audio_path))[0]
         output_path = f"{base_name}_transcription.txt"
     
+    # Reuse a previous transcription of the same audio if one is cached
+    digest = file_digest(audio_path)
+    cached_transcription = cache_path(digest, ".txt")
+    if os.path.exists(cached_transcription) and not cache_regenerate:
+        shutil.copyfile(cached_transcription, output_path)
+        if status_callback:
+            status_callback(f"Using cached transcription of {audio_path}")
+            status_callback(f"Transcription saved to: {output_path}")
+        return output_path
+    
+    # Decode the audio into memory
+    samples = load_pcm_mono16k(audio_path, status_callback, digest)
+    
     # Transcribe the audio
     if status_callback:
-        status_callback(f"Starting transcription of {wav_path}...")
-    transcription = transcribe_large_audio(wav_path, status_callback)
+        status_callback(f"Starting transcription of {audio_path}...")
+    # Save the transcription as it's produced
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as file:
+        transcription = transcribe_large_audio(samples, status_callback, output_fh=file)
     
-    # Save the transcription
-    with open(output_path, "w") as file:
-        file.write(transcription)
-    
-    # Clean up temporary WAV file if conversion was done
-    if wav_path != audio_path:
-        os.remove(wav_path)
+    # Only cache real results so failed runs are retried next time
+    if transcription.strip():
+        write_cache_file(cached_transcription, lambda tmp_path: shutil.copyfile(output_path, tmp_path))
     
     elapsed_time = time.time() - start_time
     if status_callback:
@@ -239,6 +661,9 @@ class AudioTranscriberApp:
         self.root = root
         self.root.title("Audio Transcriber")
         self.root.geometry("800x600")
+        
+        # Status messages from worker threads are queued and written to the log in batches
+        self._log_queue = queue.Queue()
         self.setup_ui()
         
         # Set dark mode theme
@@ -266,6 +691,8 @@ class AudioTranscriberApp:
         style.configure('TButton', background=button_bg, foreground=text_color, borderwidth=0)
         style.map('TButton', background=[('active', button_active)])
         style.configure('TLabel', background=bg_color, foreground=text_color)
+        style.configure('TCheckbutton', background=bg_color, foreground=text_color)
+        style.map('TCheckbutton', background=[('active', bg_color)])
         style.configure('Header.TLabel', background=bg_color, foreground=text_color, font=('Helvetica', 16, 'bold'))
         style.configure('TProgressbar', background=accent_color, troughcolor=secondary_bg)
         
@@ -325,7 +752,11 @@ class AudioTranscriberApp:
         
         # Transcription button
         self.transcribe_button = ttk.Button(main_frame, text="Transcribe Audio", command=self.start_transcription)
-        self.transcribe_button.pack(pady=20)
+        self.transcribe_button.pack(pady=(20, 5))
+        
+        # Cache option
+        self.regenerate_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(main_frame, text="Ignore cached transcription", variable=self.regenerate_var).pack(pady=(0, 10))
         self.transcribe_button.state(['disabled'])  # Initially disabled
         
         # Progress bar
@@ -341,6 +772,7 @@ class AudioTranscriberApp:
         self.log_text = ScrolledText(log_frame, height=10, wrap=tk.WORD)
         self.log_text.pack(fill=tk.BOTH, expand=True)
         self.log_text.config(state=tk.DISABLED)
+        self.root.after(LOG_REFRESH_MS, self._drain_log_queue)
     
     def enable_controls(self):
         """Enable UI controls after dependencies are loaded"""
@@ -362,8 +794,8 @@ class AudioTranscriberApp:
         if filename:
             self.file_path_var.set(filename)
             # Set default output path
-            base_name = os.path.splitext(os.path.basename(filename))[0]
-            output_path = os.path.join(os.path.dirname(filename), f"{base_name}_transcription.txt")
+            base, _ = os.path.splitext(filename)
+            output_path = f"{base}_transcription.txt"
             self.output_path_var.set(output_path)
     
     def browse_output(self):
@@ -378,12 +810,24 @@ class AudioTranscriberApp:
             self.output_path_var.set(filename)
     
     def update_status(self, message):
-        """Update the status log"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-        self.root.update_idletasks()
+        """Queue a message for the status log; safe to call from any thread"""
+        self._log_queue.put_nowait(message)
+    
+    def _drain_log_queue(self):
+        """Write all queued status messages to the log in one update, then re-arm"""
+        messages = []
+        try:
+            while True:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if messages:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        self.root.after(LOG_REFRESH_MS, self._drain_log_queue)
     
     def start_transcription(self):
         """Start the transcription process in a separate thread"""
@@ -410,14 +854,14 @@ class AudioTranscriberApp:
         # Start transcription in a separate thread
         threading.Thread(
             target=self._run_transcription,
-            args=(audio_path, output_path),
+            args=(audio_path, output_path, self.regenerate_var.get()),
             daemon=True
         ).start()
     
-    def _run_transcription(self, audio_path, output_path):
+    def _run_transcription(self, audio_path, output_path, cache_regenerate=False):
         """Run the transcription process"""
         try:
-            transcribe_audio(audio_path, output_path, self.update_status)
+            transcribe_audio(audio_path, output_path, self.update_status, cache_regenerate)
             self.root.after(0, self._transcription_complete)
         except Exception as e:
             self.root.after(0, lambda: self._transcription_error(str(e), traceback.format_exc()))